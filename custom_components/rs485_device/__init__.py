@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any, Final
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_COVERS,
@@ -17,10 +22,20 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import CURTAIN_MODEL, DOMAIN, SENSORS_MODEL, SWITCH_MODEL
+from .coordinator import RS485SensorCoordinator
 from .rs485_tcp_publisher import RS485TcpPublisher
 
+_LOGGER = logging.getLogger(__name__)
+
+WATCHDOG_INTERVAL: Final = 0.5  # 每個 slave 讀取請求之間的間隔，單位為秒
+WATCHDOG_TIMEOUT: Final = 1.0  # 單次寫入連線的期限，單位為秒
+
+# 排隊中的讀取請求: (slave, 寄存器位址, identify)
+_ReadRequest = tuple[int, int, int]
+
 PLATFORMS: dict[str, list[Platform]] = {
     CONF_SWITCHES: [Platform.SWITCH],
     CONF_COVERS: [Platform.COVER],
@@ -37,7 +52,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_registry = dr.async_get(hass)
 
     _model = None
-    _domain_data = {"watchdog_task": None}
+    _domain_data: dict[str, Any] = {"watchdog_task": None}
     if device_type == CONF_SWITCHES:
         _model = SWITCH_MODEL
         _domain_data.update(
@@ -50,7 +65,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _model = CURTAIN_MODEL
     elif device_type == CONF_SENSORS:
         _model = entry.data[SENSORS_MODEL]
-        _domain_data.update({CONF_STATE: None})
 
     # 在裝置註冊表中創建一個新的裝置
     device = device_registry.async_get_or_create(
@@ -60,17 +74,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         model=_model,
     )
 
-    hass.data.setdefault(
-        DOMAIN,
-        {
-            "rs485_tcp_publisher": RS485TcpPublisher(
-                host=entry.data[CONF_HOST], port=entry.data[CONF_PORT], byte_length=64
-            ),
-            "identify": set(),
-            "slaves": set(),
-        },
+    hass.data.setdefault(DOMAIN, {"publishers": {}, "watchdogs": {}})
+    # 連到同一個 RS-485 伺服器的裝置共用一條連線
+    host, port = entry.data[CONF_HOST], entry.data[CONF_PORT]
+    publishers: dict[tuple[str, int], RS485TcpPublisher] = hass.data[DOMAIN][
+        "publishers"
+    ]
+    if (publisher := publishers.get((host, port))) is None:
+        publisher = RS485TcpPublisher(host=host, port=port, byte_length=64)
+        publishers[(host, port)] = publisher
+    _domain_data["rs485_tcp_publisher"] = publisher
+
+    if device_type == CONF_SWITCHES:
+        # 同一個 RS-485 伺服器上所有開關的初始讀取，由同一個 watchdog 合併發送
+        watchdogs: dict[
+            tuple[str, int], tuple[asyncio.Queue[_ReadRequest], asyncio.Task]
+        ] = hass.data[DOMAIN]["watchdogs"]
+        watchdog = watchdogs.get((host, port))
+        if watchdog is None or watchdog[1].done():
+            queue: asyncio.Queue[_ReadRequest] = asyncio.Queue()
+            # 由 Home Assistant 管理的背景任務，關閉時會自動取消
+            task = hass.async_create_background_task(
+                _async_watchdog(publisher, queue),
+                name=f"{DOMAIN} watchdog {host}:{port}",
+            )
+            watchdog = (queue, task)
+            watchdogs[(host, port)] = watchdog
+        _domain_data["watchdog_queue"] = watchdog[0]
+
+    if device_type == CONF_SENSORS:
+        # 依更新間隔分組的協調器，由各平台透過 async_register_descriptions 建立
+        _domain_data["coordinators"] = {}
+    # 同一個條目的實體共用同一份裝置資訊
+    _domain_data["device_info"] = DeviceInfo(
+        identifiers=device.identifiers,
+        name=device.name,
+        manufacturer=device.manufacturer,
+        model=device.model,
+        connections=device.connections,
     )
-    hass.data[DOMAIN][entry.entry_id] = {CONF_DEVICE: device, **_domain_data}
+    hass.data[DOMAIN][entry.entry_id] = _domain_data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS[device_type])
 
@@ -84,6 +127,61 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS[device_type]
     ):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinators: dict[timedelta, RS485SensorCoordinator] = entry_data.get(
+            "coordinators", {}
+        )
+        for coordinator in coordinators.values():
+            await coordinator.async_shutdown()
+
+        # 伺服器已沒有任何訂閱者時，一併停止它的 watchdog
+        if entry_data["rs485_tcp_publisher"].subscribers_length == 0 and (
+            watchdog := hass.data[DOMAIN]["watchdogs"].pop(
+                (entry.data[CONF_HOST], entry.data[CONF_PORT]), None
+            )
+        ):
+            watchdog[1].cancel()
 
     return unload_ok
+
+
+async def _async_watchdog(
+    publisher: RS485TcpPublisher, queue: asyncio.Queue[_ReadRequest]
+) -> None:
+    """等待 RS-485 伺服器連線後，合併排隊中的讀取請求，每個 slave 只發送一次."""
+    try:
+        while True:
+            pending = [await queue.get()]
+            while not publisher.is_running:
+                _LOGGER.debug("❓ Publisher is running?: %s ❓", publisher.is_running)
+                await asyncio.sleep(3)
+            # 等待連線期間加入的請求一起處理
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+
+            # 依 slave 分組，同一個位址只讀取一次
+            reads: dict[int, dict[int, int]] = {}
+            for slave, address, identify in pending:
+                reads.setdefault(slave, {}).setdefault(address, identify)
+
+            # 每個 slave 送出一個涵蓋所有位址的讀取，回應由 publisher 依 slave 分派
+            for slave, addresses in reads.items():
+                start = min(addresses)
+                message = publisher.construct_modbus_message(
+                    slave,
+                    3,
+                    start,
+                    length=max(addresses) - start + 1,
+                    identify=addresses[start],
+                )
+                await asyncio.sleep(WATCHDOG_INTERVAL)
+                # 不傳入 slave：_last_tx_per_slave 是窗簾以自訂協定位址節流用的
+                await publisher.send_message(message)
+                try:
+                    # send_message 只放入緩衝區，期限加在實際寫入連線的 flush 上
+                    async with asyncio.timeout(WATCHDOG_TIMEOUT):
+                        await publisher.flush()
+                except TimeoutError:
+                    _LOGGER.warning("⛔️ 發送 slave %s 的讀取請求逾時 ⛔️", slave)
+    except asyncio.CancelledError:
+        _LOGGER.info("Watchdog task was cancelled")
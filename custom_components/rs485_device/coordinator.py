@@ -0,0 +1,205 @@
+"""RS485 Sensor data coordinator."""
+import asyncio
+from collections.abc import Iterable
+from datetime import timedelta
+import logging
+import struct
+from typing import Final, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SLAVE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .rs485_tcp_publisher import RS485TcpPublisher
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL: Final = timedelta(seconds=5)
+RESPONSE_TIMEOUT: Final = 3
+# 讀取失敗後重試的間隔，不必等待完整的更新間隔
+RETRY_INTERVAL: Final = timedelta(seconds=5)
+
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
+
+@callback
+def async_get_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, update_interval: timedelta
+) -> "RS485SensorCoordinator":
+    """取得條目中指定更新間隔的協調器，不存在時建立一個."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinators: dict[timedelta, RS485SensorCoordinator] = entry_data["coordinators"]
+    if (coordinator := coordinators.get(update_interval)) is None:
+        coordinator = RS485SensorCoordinator(
+            hass,
+            entry_data["rs485_tcp_publisher"],
+            entry.data[CONF_SLAVE],
+            f"{entry.entry_id}_{update_interval}",
+            update_interval,
+        )
+        coordinators[update_interval] = coordinator
+    return coordinator
+
+
+@callback
+def async_register_descriptions(
+    hass: HomeAssistant, entry: ConfigEntry, descriptions: Iterable[_DescriptionT]
+) -> list[tuple[_DescriptionT, "RS485SensorCoordinator"]]:
+    """登記描述的寄存器位址，並返回每個描述與其協調器.
+
+    更新間隔相同的描述共用一個協調器，每個協調器只讀取自己那段連續範圍。
+    """
+    registered: list[tuple[_DescriptionT, RS485SensorCoordinator]] = []
+    for description in descriptions:
+        coordinator = async_get_coordinator(hass, entry, description.poll_interval)
+        coordinator.register_address(description.address)
+        registered.append((description, coordinator))
+    return registered
+
+
+class RS485SensorCoordinator(DataUpdateCoordinator[tuple[int, ...]]):
+    """同一個 slave 中更新間隔相同的感應器共用的協調器，一次讀取連續的保持寄存器."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        publisher: RS485TcpPublisher,
+        slave: int,
+        sub_id: str,
+        update_interval: timedelta = UPDATE_INTERVAL,
+    ) -> None:
+        """初始化協調器."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"RS-485 slave {slave} ({update_interval})",
+            update_interval=update_interval,
+        )
+        self._publisher = publisher
+        self._slave = slave
+        self._poll_interval = update_interval
+        self._started = False
+        self._sub_id = sub_id
+        self._subscribed_identify: int | None = None
+        # 依 slave 錯開各裝置的讀取時間
+        self._sleep = 0.1 + (slave % 10) / 10
+        self._addresses: set[int] = set()
+        self._start = 0  # self.data 第一個寄存器的位址
+        self._request_start = 0
+        self._identify = 0
+        self._message: bytes | None = None  # 快取的讀取請求
+        self._struct: struct.Struct | None = None  # 對應回應長度的解碼器
+        self._response: asyncio.Future[tuple[int, ...]] | None = None
+
+    def register_address(self, address: int) -> None:
+        """登記需要讀取的寄存器位址."""
+        if address not in self._addresses:
+            self._addresses.add(address)
+            self._message = None
+
+    async def async_start(self) -> None:
+        """啟動 RS-485 伺服器的連線，並立即讀取一次，不等待第一個更新間隔."""
+        if self._started:
+            return
+        self._started = True
+        # 先訂閱再連線，讓共用這個伺服器的其他條目卸載時不會把連線關閉
+        await self._async_subscribe()
+        await self._publisher.start()
+        await self.async_request_refresh()
+
+    async def _async_subscribe(self) -> None:
+        """依已登記的位址建立讀取請求，並只訂閱回應這個請求的數據."""
+        if not self._addresses:
+            return
+        if self._message is None:
+            self._build_message()
+        if self._subscribed_identify != self._identify:
+            await self._publisher.subscribe(
+                self._subscribe_callback,
+                self._sub_id,
+                identify=self._identify,
+                slave=self._slave,
+            )
+            self._subscribed_identify = self._identify
+
+    def get_register(self, address: int) -> int | None:
+        """返回指定位址的寄存器數值."""
+        if self.data is None:
+            return None
+        offset = address - self._start
+        if 0 <= offset < len(self.data):
+            return self.data[offset]
+        return None
+
+    async def _subscribe_callback(self, sub_id: str, data: bytes) -> None:
+        """訂閱回調函數."""
+        if self._struct is None or len(data) < 9 + self._struct.size:
+            return
+
+        # 將大端序的雙字節轉換為寄存器數值
+        data_tuple: tuple[int, ...] = self._struct.unpack_from(data, 9)
+        if self._response is not None and not self._response.done():
+            self._response.set_result(data_tuple)
+        else:
+            # 不是由協調器發出的讀取，直接更新數據
+            self.async_set_updated_data(data_tuple)
+
+    async def _async_update_data(self) -> tuple[int, ...]:
+        """讀取寄存器，失敗時改以 RETRY_INTERVAL 重試."""
+        try:
+            data = await self._async_read()
+        except UpdateFailed:
+            self.update_interval = min(self._poll_interval, RETRY_INTERVAL)
+            raise
+        self.update_interval = self._poll_interval
+        return data
+
+    async def _async_read(self) -> tuple[int, ...]:
+        """讀取所有已登記位址所涵蓋的寄存器範圍."""
+        if not self._addresses:
+            return ()
+        # 之後才登記的位址會改變讀取範圍，需要重新訂閱
+        await self._async_subscribe()
+        if not self._publisher.is_running:
+            raise UpdateFailed("RS-485 伺服器尚未連線")
+
+        await asyncio.sleep(self._sleep)
+
+        self._response = self.hass.loop.create_future()
+        await self._publisher.send_message(self._message)
+        try:
+            async with asyncio.timeout(RESPONSE_TIMEOUT):
+                data = await self._response
+        except TimeoutError as err:
+            raise UpdateFailed(f"Slave {self._slave} 沒有回應") from err
+        finally:
+            self._response = None
+
+        self._start = self._request_start
+        return data
+
+    def _build_message(self) -> None:
+        """依已登記的位址建立涵蓋整個範圍的讀取請求."""
+        start = min(self._addresses)
+        length = max(self._addresses) - start + 1
+        self._request_start = start
+        self._identify = self._slave + start
+        self._message = self._publisher.construct_modbus_message(
+            self._slave, 3, start, length=length, identify=self._identify
+        )
+        self._struct = struct.Struct(f">{length}H")
+
+    async def async_shutdown(self) -> None:
+        """停止更新並取消訂閱."""
+        await super().async_shutdown()
+        if self._subscribed_identify is not None:
+            await self._publisher.unsubscribe(self._sub_id)
+            self._subscribed_identify = None
+
+        # 如果沒有訂閱者，則關閉 rs-485 伺服器的連接
+        if self._publisher.subscribers_length == 0:
+            await self._publisher.close()
+            _LOGGER.info("🚧 Close publisher connect 🚧")
@@ -39,66 +39,62 @@ async def async_setup_entry(
     """通過配置條目設置開關實體."""
 
     # 從 entry.data 中獲取配置數據
-    config = {
-        **entry.data,
-        "entry_id": entry.entry_id,
-    }
-
-    async_add_entities([RS485CurtainCover(hass, config)], True)
+    slave: int = entry.data.get(CONF_SLAVE, 0)
+    async_add_entities(
+        [RS485CurtainCover(hass, slave=slave, entry_id=entry.entry_id)], True
+    )
 
 
 class RS485CurtainCover(CoverEntity):
     """表示一个窗帘类的 cover 设备."""
 
+    __slots__ = (
+        "_is_open",
+        "_slave",
+        "_slave_bytes",
+        "_watchdog_frame",
+        "_entry_id",
+        "_entry_data",
+        "_moving",
+        "_unique_id",
+        "_position",
+        "_destination",
+        "_watching",
+        "_publisher",
+        "_watchdog_task",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = CoverDeviceClass.CURTAIN
+    _attr_name = ""
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+    def __init__(self, hass: HomeAssistant, *, slave: int, entry_id: str) -> None:
         """初始化窗帘 cover 实体."""
         self.hass = hass
         self._is_open: bool = False
-        self._slave: int = config.get(CONF_SLAVE, 0)
+        self._slave: int = slave
         self._slave_bytes: bytes = self._slave.to_bytes(2, byteorder="big")
-        self._entry_id: str = config.get("entry_id", "")
+        # 查詢窗簾位置的訊息，在實體的生命週期內不會改變
+        self._watchdog_frame: bytes = (
+            b"\x00\x8C\x00\x00\x00\x06\x55" + self._slave_bytes + b"\x01\x02\x01"
+        )
+        self._entry_id: str = entry_id
         self._moving: bool = False
         self._unique_id: str = f"{self._entry_id}"
+        self._attr_unique_id = self._unique_id
         self._position: int = 100
         self._destination: int = 100
         self._watching: bool = True
-        self._publisher: RS485TcpPublisher = self.hass.data[DOMAIN][
-            "rs485_tcp_publisher"
-        ]
-        self._identify_set: set[int] = self.hass.data[DOMAIN]["identify"]
-        self._slaves_set: set[int] = self.hass.data[DOMAIN]["slaves"]
-        self._watchdog_task = self.hass.data[DOMAIN][self._entry_id]["watchdog_task"]
-
-    @property
-    def name(self) -> str:
-        """返回实体的名字."""
-        return ""
-
-    @property
-    def unique_id(self) -> str:
-        """返回實體的唯一 ID."""
-        return self._unique_id
+        self._entry_data: dict[str, Any] = self.hass.data[DOMAIN][self._entry_id]
+        self._publisher: RS485TcpPublisher = self._entry_data["rs485_tcp_publisher"]
+        self._watchdog_task = self._entry_data["watchdog_task"]
+        self._attr_device_info: DeviceInfo = self._entry_data["device_info"]
 
     @property
     def is_closed(self) -> bool:
         """如果窗帘关闭返回 True."""
         return self._position == 0
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        device = self.hass.data[DOMAIN][self._entry_id]["device"]
-        return {
-            "identifiers": device.identifiers,
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.model,
-            "connections": device.connections,
-        }
-
     @property
     def supported_features(self) -> CoverEntityFeature:
         """返回该实体支持的功能."""
@@ -123,20 +119,16 @@ class RS485CurtainCover(CoverEntity):
         try:
             while True:
                 if self._publisher.is_running and self._watching:
-                    await asyncio.wait_for(
-                        self._publisher.send_message(
-                            b"\x00\x8C\x00\x00\x00\x06\x55"
-                            + self._slave_bytes
-                            + b"\x01\x02\x01"
-                        ),
-                        timeout=1,
+                    # 若最近一秒內已對此窗簾發送過訊息，則略過這次查詢
+                    await self._publisher.maybe_send(
+                        self._watchdog_frame, self._slave, 1.0
                     )
                 await asyncio.sleep(1)
         except asyncio.CancelledError:
             _LOGGER.info("Watchdog task was cancelled")
             return
 
-    async def _subscribe_callback(self, sub_id: str, data: tuple[int]) -> None:
+    async def _subscribe_callback(self, sub_id: str, data: bytes) -> None:
         if sub_id != self._unique_id:
             return
 
@@ -145,21 +137,23 @@ class RS485CurtainCover(CoverEntity):
             _LOGGER.error("Received data too short: %s", data)
             return
 
-        if data[1] != 140:  # type: ignore[misc]
+        if data[1] != 140:
             _LOGGER.error("Unexpected data format: %s", data)
             return
 
-        high_byte, low_byte = data[7:9][::-1]  # type: ignore[misc]
-        _slave = (high_byte << 8) | low_byte
+        _slave = (data[8] << 8) | data[7]
 
-        _LOGGER.info("📡 Curtain Received data: %s %s 📡", data, self._moving)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "📡 Curtain Received data: %s %s 📡", data.hex(" "), self._moving
+            )
         if _slave == self._slave:
-            data_length = data[5]  # type: ignore[misc]
+            data_length = data[5]
             position = self._position
             if data_length == 6:
-                position = 100 - data[-1:][0]
+                position = 100 - data[-1]
             if data_length > 10:
-                position = data[-1:][0]
+                position = data[-1]
 
             if position != self._position:
                 if self._moving:
@@ -180,8 +174,6 @@ class RS485CurtainCover(CoverEntity):
         # 設置 watchdog 任務
         if self._watchdog_task is None:
             self._watchdog_task = asyncio.create_task(self._watchdogs())
-        self._identify_set.add(140)
-        self._slaves_set.add(85)
 
     async def async_will_remove_from_hass(self):
         """當實體從 Home Assistant 中移除時，取消計劃."""
@@ -197,46 +189,46 @@ class RS485CurtainCover(CoverEntity):
     async def async_update(self):
         """更新窗帘的状态."""
         if not self._watching:
-            _LOGGER.info("Updating the curtain %s")
-            await self._publisher.send_message(
-                b"\x00\x8C\x00\x00\x00\x06\x55" + self._slave_bytes + b"\x01\x02\x01"
-            )
-            self.schedule_update_ha_state()
+            _LOGGER.debug("Updating the curtain %s", self._slave)
+            await self._publisher.send_message(self._watchdog_frame, self._slave)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """停止窗簾."""
         _LOGGER.info("Stopping the curtain")
         await self._publisher.send_message(
-            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x03"
+            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x03",
+            self._slave,
         )
-        await asyncio.sleep(1)
+        await self._publisher.flush()
         self._moving = False
         self._watching = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """關閉窗簾."""
         _LOGGER.info("Closing the curtain")
         await self._publisher.send_message(
-            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x01"
+            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x01",
+            self._slave,
         )
-        await asyncio.sleep(1)
+        await self._publisher.flush()
         self._is_open = True
         self._moving = False
         self._position = 0
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """打開窗簾."""
         _LOGGER.info("Opening the curtain")
         await self._publisher.send_message(
-            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x02"
+            b"\x00\x8C\x00\x00\x00\x05\x55" + self._slave_bytes + b"\x03\x02",
+            self._slave,
         )
-        await asyncio.sleep(1)
+        await self._publisher.flush()
         self._is_open = False
         self._moving = False
         self._position = 100
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """设置窗帘的位置."""
@@ -247,11 +239,12 @@ class RS485CurtainCover(CoverEntity):
                 b"\x00\x8C\x00\x00\x00\x06\x55"
                 + self._slave_bytes
                 + b"\x03\x04"
-                + bytes([100 - position])
+                + bytes([100 - position]),
+                self._slave,
             )
-            await asyncio.sleep(1)
+            await self._publisher.flush()
             self._moving = True
             self._position = position
             self._destination = position
             self._is_open = position > 0
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
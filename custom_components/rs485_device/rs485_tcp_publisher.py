@@ -1,10 +1,17 @@
 """RS485 TCP Publisher."""
 import asyncio
 import logging
-from typing import Any
+import socket
+from typing import Any, Final
 
 _LOGGER = logging.getLogger(__name__)
 
+MBAP_HEADER_LENGTH: Final = 6  # 交易 ID、協定 ID 與長度欄位
+MAX_FRAME_LENGTH: Final = 260  # Modbus TCP 訊息的最大長度
+MAX_UNIT_ID: Final = 247
+MAX_FUNCTION_CODE: Final = 0x2B
+CURTAIN_UNIT_ID: Final = 0x55  # 窗簾使用自訂協定，data[7] 不是功能碼
+
 
 class RS485TcpPublisher:
     """RS485 TCP Publisher."""
@@ -16,6 +23,10 @@ class RS485TcpPublisher:
         byte_length: int = 12,
         max_retry_delay: int = 60,
         connect_timeout: int = 10,
+        flush_delay: float = 0.01,
+        flush_threshold: int = 256,
+        tcp_nodelay: bool = True,
+        frame_timeout: float = 0.1,
     ) -> None:
         """初始化 RS485 TCP Publisher 服務."""
 
@@ -26,18 +37,31 @@ class RS485TcpPublisher:
         self.byte_length = byte_length  # 用於存儲接收數據的字節長度
         self.connection_task = None  # 用於存儲連接任務的引用
         self.subscribers: dict[str, Any] = {}
+        # 指定 (identify, slave) 的訂閱者只會收到符合的數據，identify 為 None 時只比對 slave
+        self._routes: dict[tuple[int | None, int], dict[str, Any]] = {}
+        self._route_keys: dict[str, tuple[int | None, int]] = {}
+        self._broadcast: dict[str, Any] = {}  # 接收所有數據的訂閱者
         self.lock = asyncio.Lock()  # 增加一個鎖來控制對訂閱者列表的訪問
         self._running = False  # 增加一個運行狀態標誌
         self.is_running = False
         self.writer = None  # 用於存儲當前連接的StreamWriter對象
+        self.flush_delay = flush_delay  # 合併發送的等待時間，單位為秒
+        self.flush_threshold = flush_threshold  # 緩衝區超過此長度時立即發送
+        # 訊息已在 _tx_buf 中合併，關閉 Nagle 演算法避免短訊息被核心延遲送出
+        self.tcp_nodelay = tcp_nodelay
+        self._tx_buf = bytearray()  # 待發送訊息的緩衝區
+        # 不完整的訊息超過此時間沒有補齊就丟棄，單位為秒
+        self.frame_timeout = frame_timeout
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._last_tx_per_slave: dict[int, float] = {}  # 每個 slave 最後發送的時間
 
     @property
     def subscribers_length(self) -> int:
         """返回 self.subscribers 的長度作为属性."""
         return len(self.subscribers)
 
+    @staticmethod
     def construct_modbus_message(
-        self,
         slave: int,
         function_code: int,
         register: int,
@@ -69,13 +93,29 @@ class RS485TcpPublisher:
             )
         return message
 
-    async def subscribe(self, callback, callback_id=None) -> None:
-        """訂閱數據，必須提供 ID."""
+    async def subscribe(
+        self,
+        callback,
+        callback_id=None,
+        identify: int | None = None,
+        slave: int | None = None,
+    ) -> None:
+        """訂閱數據，必須提供 ID.
+
+        提供 slave 時只會收到 data[6] 相符的數據，再提供 identify 時 data[1] 也必須相符。
+        """
         if callback_id is None:
             _LOGGER.error("訂閱必須包括一個唯一的ID。")
             return
         async with self.lock:  # 使用異步鎖來保護訂閱者列表的修改
+            self._remove_route(callback_id)
             self.subscribers[callback_id] = callback
+            if slave is not None:
+                key = (identify, slave)
+                self._routes.setdefault(key, {})[callback_id] = callback
+                self._route_keys[callback_id] = key
+            else:
+                self._broadcast[callback_id] = callback
             _LOGGER.info("訂閱者: %s 已添加", callback_id)
 
     async def unsubscribe(self, callback_id):
@@ -83,26 +123,83 @@ class RS485TcpPublisher:
         async with self.lock:
             if callback_id in self.subscribers:
                 del self.subscribers[callback_id]
+                self._remove_route(callback_id)
                 _LOGGER.info("訂閱者: %s 已移除", callback_id)
             else:
                 _LOGGER.info('沒有找到 ID 為"%s"的訂閱者', callback_id)
 
-    async def send_message(self, message: bytes) -> None:
-        """向 RS-485 伺服器發送訊息."""
+    def _remove_route(self, callback_id: str) -> None:
+        """從路由表中移除訂閱者."""
+        self._broadcast.pop(callback_id, None)
+        if (key := self._route_keys.pop(callback_id, None)) is not None:
+            route = self._routes[key]
+            del route[callback_id]
+            if not route:
+                del self._routes[key]
+
+    async def send_message(self, message: bytes, slave: int | None = None) -> None:
+        """向 RS-485 伺服器發送訊息.
+
+        訊息會先放入緩衝區，在 flush_delay 後與其他訊息合併成一次寫入，
+        Modbus TCP 的 MBAP 標頭已包含長度，所以串接多筆訊息是安全的。
+        """
 
-        _LOGGER.info("💬 Message: %s 💬", message)
+        _LOGGER.debug("💬 Message: %s 💬", message)
         if self.writer is None or self.writer.is_closing():
             _LOGGER.error("⛔️ 無有效連線，無法發送訊息。⛔️")
             return
 
+        self._tx_buf += message
+        if slave is not None:
+            self._last_tx_per_slave[slave] = asyncio.get_running_loop().time()
+        if len(self._tx_buf) >= self.flush_threshold:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.flush_delay, self._flush
+            )
+
+    async def maybe_send(self, message: bytes, slave: int, min_interval: float) -> bool:
+        """發送訊息，若該 slave 在 min_interval 秒內已發送過訊息則略過."""
+        last = self._last_tx_per_slave.get(slave)
+        if (
+            last is not None
+            and asyncio.get_running_loop().time() - last < min_interval
+        ):
+            return False
+        await self.send_message(message, slave)
+        return True
+
+    async def flush(self) -> None:
+        """立即送出緩衝區中的訊息，用於需要低延遲的指令."""
+        self._flush()
+        if self.writer is None or self.writer.is_closing():
+            return
+
         async with self.lock:
             try:
-                self.writer.write(message)
                 await self.writer.drain()
-                _LOGGER.info("🚀 訊息已成功發送。 🚀")
             except Exception as e:  # pylint: disable=broad-except
                 _LOGGER.error("🚧 發送訊息時出錯: %s 🚧", e)
 
+    def _flush(self) -> None:
+        """將緩衝區中的訊息一次寫入連線."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._tx_buf:
+            return
+
+        if self.writer is None or self.writer.is_closing():
+            _LOGGER.error("⛔️ 無有效連線，無法發送訊息。⛔️")
+        else:
+            try:
+                self.writer.write(bytes(self._tx_buf))
+                _LOGGER.debug("🚀 訊息已成功發送。 🚀")
+            except Exception as e:  # pylint: disable=broad-except
+                _LOGGER.error("🚧 發送訊息時出錯: %s 🚧", e)
+        self._tx_buf.clear()
+
     # async def read_register(self, slave: int, register: int, length: int) -> None:
     #     """讀取寄存器。構造並發送Modbus TCP請求讀取保持寄存器的消息."""
     #     message = self._construct_modbus_message(slave, 3, register, length=length)
@@ -113,13 +210,20 @@ class RS485TcpPublisher:
     #     message = self._construct_modbus_message(slave, 6, register, value=value)
     #     await self._send_message(message)
 
-    async def _publish(self, data):
-        """發布數據給所有訂閱者，並返回他們的 ID."""
+    async def _publish(self, data: bytes) -> None:
+        """發布數據給相符的訂閱者，並返回他們的 ID."""
         tasks = []
         async with self.lock:
-            for callback_id, callback in self.subscribers.items():
+            for callback_id, callback in self._broadcast.items():
                 task = asyncio.create_task(callback(sub_id=callback_id, data=data))
                 tasks.append(task)
+            if len(data) > 6:
+                for key in ((data[1], data[6]), (None, data[6])):
+                    for callback_id, callback in self._routes.get(key, {}).items():
+                        task = asyncio.create_task(
+                            callback(sub_id=callback_id, data=data)
+                        )
+                        tasks.append(task)
         # results = await asyncio.gather(*tasks, return_exceptions=True)
         # for task, result in zip(tasks, results):
         #     if isinstance(result, Exception):
@@ -136,6 +240,7 @@ class RS485TcpPublisher:
                     timeout=self.connect_timeout,
                 )
                 _LOGGER.info("成功連接到 %s:%i", self.host, self.port)
+                self._set_nodelay()
                 self.is_running = True
                 retry_delay = 1  # 連接成功，重置重試間隔
                 await self._manage_connection(reader)
@@ -156,18 +261,82 @@ class RS485TcpPublisher:
                 if self.writer:
                     await self._close_writer()
 
+    def _set_nodelay(self) -> None:
+        """依 tcp_nodelay 設定連線的 TCP_NODELAY 選項."""
+        sock: socket.socket | None = self.writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.tcp_nodelay)
+            )
+        except OSError as e:
+            _LOGGER.warning("無法設定 TCP_NODELAY: %s", e)
+
     async def _manage_connection(self, reader):
+        rx_buf = bytearray()  # 尚未組成完整訊息的數據
         try:
             while True:
-                data = await reader.read(self.byte_length)
+                try:
+                    # 有不完整的訊息時，只等待 frame_timeout 秒讓剩下的數據到達
+                    async with asyncio.timeout(self.frame_timeout if rx_buf else None):
+                        data = await reader.read(self.byte_length)
+                except TimeoutError:
+                    self._drop_partial(rx_buf)
+                    continue
                 if not data:
                     _LOGGER.warning("連線被關閉，準備重新連接…")
                     break
-                await self._publish(tuple(data))
+                if rx_buf and self._is_frame_start(data):
+                    # 新的回應已經開始，之前不完整的數據不會再補齊
+                    self._drop_partial(rx_buf)
+                rx_buf += data
+                for frame in self._split_frames(rx_buf):
+                    await self._publish(frame)
         except asyncio.CancelledError:
             _LOGGER.info("連線被取消")
 
+    @staticmethod
+    def _drop_partial(rx_buf: bytearray) -> None:
+        """丟棄無法補齊的不完整訊息，避免與之後的回應合併."""
+        _LOGGER.debug("🚧 丟棄不完整的訊息: %s 🚧", rx_buf.hex(" "))
+        rx_buf.clear()
+
+    @staticmethod
+    def _is_frame_start(data: bytes | bytearray) -> bool:
+        """檢查數據開頭是否為合理的 MBAP 標頭，以及其後的 unit ID 與功能碼."""
+        if len(data) < MBAP_HEADER_LENGTH + 2 or data[2:4] != b"\x00\x00":
+            return False
+        frame_length = MBAP_HEADER_LENGTH + int.from_bytes(data[4:6], "big")
+        if not MBAP_HEADER_LENGTH + 2 <= frame_length <= MAX_FRAME_LENGTH:
+            return False
+        unit_id, function_code = data[6], data[7]
+        if unit_id == CURTAIN_UNIT_ID:
+            return True
+        return unit_id <= MAX_UNIT_ID and 1 <= function_code & 0x7F <= MAX_FUNCTION_CODE
+
+    @staticmethod
+    def _split_frames(rx_buf: bytearray) -> list[bytes]:
+        """依 MBAP 標頭的長度將緩衝區切成完整的訊息，不完整的部分留在緩衝區.
+
+        發送端會合併多筆請求，回應也可能在同一次讀取中一起到達。
+        """
+        frames: list[bytes] = []
+        while len(rx_buf) >= MBAP_HEADER_LENGTH + 2:
+            if not RS485TcpPublisher._is_frame_start(rx_buf):
+                # 不是 Modbus TCP 訊息，整段交給訂閱者自行判斷
+                frames.append(bytes(rx_buf))
+                rx_buf.clear()
+                break
+            frame_length = MBAP_HEADER_LENGTH + int.from_bytes(rx_buf[4:6], "big")
+            if len(rx_buf) < frame_length:
+                break
+            frames.append(bytes(rx_buf[:frame_length]))
+            del rx_buf[:frame_length]
+        return frames
+
     async def _close_writer(self):
+        self._flush()
         if self.writer and not self.writer.is_closing():
             self.writer.close()
             await self.writer.wait_closed()
@@ -185,6 +354,7 @@ class RS485TcpPublisher:
     async def close(self):
         """關閉當前連接並停止嘗試重連."""
         self._running = False  # 設置運行狀態為False以停止重連嘗試
+        self._flush()
         if self.connection_task and not self.connection_task.done():
             self.connection_task.cancel()
             try:
@@ -1,7 +1,9 @@
 """RS485 Sensor component."""
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import timedelta
 import logging
+from types import MappingProxyType
 from typing import Any, Final
 
 from homeassistant.components.sensor import (
@@ -12,21 +14,19 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_SLAVE,
-    CONF_STATE,
     PERCENTAGE,
     UnitOfLength,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SENSORS_MODEL
+from .coordinator import RS485SensorCoordinator, async_register_descriptions
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=3)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -34,85 +34,105 @@ class RS485SensorEntityDescription(SensorEntityDescription):
     """針對 RS485 的感應器擴充屬性."""
 
     address: int | None = None
+    poll_interval: timedelta = timedelta(seconds=5)
+
+
+# 靈敏度、距離與延遲為設定值，很少改變，不需要跟即時狀態一樣頻繁讀取
+SETTING_POLL_INTERVAL: Final = timedelta(minutes=5)
+
+SENSOR_TYPES: Final[
+    Mapping[str, tuple[RS485SensorEntityDescription, ...]]
+] = MappingProxyType(
+    {
+        "SD123-HPR05": (
+            RS485SensorEntityDescription(
+                key="human_radar",
+                name="Human Radar Detection",
+                device_class="motion",
+                address=12,
+                icon="mdi:radar",
+                native_unit_of_measurement="",
+            ),
+            RS485SensorEntityDescription(
+                key="human_motion",
+                name="Human Motion",
+                device_class="motion",
+                address=13,
+                icon="mdi:motion-sensor",
+                native_unit_of_measurement=PERCENTAGE,
+            ),
+            RS485SensorEntityDescription(
+                key="presence_detection",
+                name="Presence Detection Sensitivity",
+                device_class="motion",
+                address=21,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:leak",
+                native_unit_of_measurement="",
+            ),
+            RS485SensorEntityDescription(
+                key="state_detection",
+                name="State Detection Sensitivity",
+                device_class="motion",
+                address=22,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:leak",
+                native_unit_of_measurement="",
+            ),
+            RS485SensorEntityDescription(
+                key="presence_detection_range",
+                name="Presence Detection Range",
+                device_class=SensorDeviceClass.DISTANCE,
+                address=23,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:ruler",
+                native_unit_of_measurement=UnitOfLength.METERS,
+            ),
+            RS485SensorEntityDescription(
+                key="motion_state_detection_range",
+                name="Motion State Detection Range",
+                device_class=SensorDeviceClass.DISTANCE,
+                address=25,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:ruler",
+                native_unit_of_measurement=UnitOfLength.METERS,
+            ),
+            RS485SensorEntityDescription(
+                key="delay_for_motion_state_trigger",
+                name="Delay for Motion State Trigger",
+                device_class=SensorDeviceClass.DURATION,
+                address=28,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:timer-sand-complete",
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            ),
+            RS485SensorEntityDescription(
+                key="delay_from_motion_to_stationary_state",
+                name="Delay from Motion to Stationary State",
+                device_class=SensorDeviceClass.DURATION,
+                address=32,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:timer-pause-outline",
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            ),
+            RS485SensorEntityDescription(
+                key="delay_from_stationary_to_unoccupied_state",
+                name="Delay from Stationary to Unoccupied State",
+                device_class=SensorDeviceClass.DURATION,
+                address=36,
+                poll_interval=SETTING_POLL_INTERVAL,
+                icon="mdi:timer-play-outline",
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            ),
+        ),
+        # 溫濕度的寄存器位址尚未確認，在此之前不建立任何感應器
+        "SD123-HPR06": (),
+    }
+)
 
 
-SENSOR_TYPES: Final = {
-    "SD123-HPR05": (
-        RS485SensorEntityDescription(
-            key="human_radar",
-            name="Human Radar Detection",
-            device_class="motion",
-            address=12,
-            icon="mdi:radar",
-            native_unit_of_measurement="",
-        ),
-        RS485SensorEntityDescription(
-            key="human_motion",
-            name="Human Motion",
-            device_class="motion",
-            address=13,
-            icon="mdi:motion-sensor",
-            native_unit_of_measurement=PERCENTAGE,
-        ),
-        RS485SensorEntityDescription(
-            key="presence_detection",
-            name="Presence Detection Sensitivity",
-            device_class="motion",
-            address=21,
-            icon="mdi:leak",
-            native_unit_of_measurement="",
-        ),
-        RS485SensorEntityDescription(
-            key="state_detection",
-            name="State Detection Sensitivity",
-            device_class="motion",
-            address=22,
-            icon="mdi:leak",
-            native_unit_of_measurement="",
-        ),
-        RS485SensorEntityDescription(
-            key="presence_detection_range",
-            name="Presence Detection Range",
-            device_class=SensorDeviceClass.DISTANCE,
-            address=23,
-            icon="mdi:ruler",
-            native_unit_of_measurement=UnitOfLength.METERS,
-        ),
-        RS485SensorEntityDescription(
-            key="motion_state_detection_range",
-            name="Motion State Detection Range",
-            device_class=SensorDeviceClass.DISTANCE,
-            address=25,
-            icon="mdi:ruler",
-            native_unit_of_measurement=UnitOfLength.METERS,
-        ),
-        RS485SensorEntityDescription(
-            key="delay_for_motion_state_trigger",
-            name="Delay for Motion State Trigger",
-            device_class=SensorDeviceClass.DURATION,
-            address=28,
-            icon="mdi:timer-sand-complete",
-            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
-        ),
-        RS485SensorEntityDescription(
-            key="delay_from_motion_to_stationary_state",
-            name="Delay from Motion to Stationary State",
-            device_class=SensorDeviceClass.DURATION,
-            address=32,
-            icon="mdi:timer-pause-outline",
-            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
-        ),
-        RS485SensorEntityDescription(
-            key="delay_from_stationary_to_unoccupied_state",
-            name="Delay from Stationary to Unoccupied State",
-            device_class=SensorDeviceClass.DURATION,
-            address=36,
-            icon="mdi:timer-play-outline",
-            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
-        ),
-    ),
-    "SD123-HPR06": ["temperature", "humidity"],
-}
+# human_radar 寄存器數值對應的描述
+HUMAN_RADAR_STATE: Final[dict[int, str]] = {0: "無人", 1: "靜止", 2: "活動"}
 
 
 async def async_setup_entry(
@@ -120,115 +140,82 @@ async def async_setup_entry(
 ) -> None:
     """通過配置條目設置感應器."""
     # 從 entry.data 中獲取配置數據
-    config = {
-        **entry.data,
-        "entry_id": entry.entry_id,
-    }
-
+    slave: int = entry.data.get(CONF_SLAVE, 0)
     sensor_model: str = entry.data.get(SENSORS_MODEL, "SD123-HPR05")
-    sensors = []
-    for description in SENSOR_TYPES[sensor_model]:
-        sensors.append(RS485Sensor(hass, config, description))
-    async_add_entities(sensors, True)
-
-
-class RS485Sensor(SensorEntity):
+    async_add_entities(
+        [
+            RS485Sensor(
+                hass,
+                coordinator,
+                slave=slave,
+                entry_id=entry.entry_id,
+                description=description,
+            )
+            for description, coordinator in async_register_descriptions(
+                hass, entry, SENSOR_TYPES[sensor_model]
+            )
+        ]
+    )
+
+
+class RS485Sensor(CoordinatorEntity[RS485SensorCoordinator], SensorEntity):
     """RS485 Sensor entity."""
 
+    __slots__ = ("_entry_id", "_entry_data", "_slave", "_unique_id")
+
     _attr_has_entity_name = True
     entity_description: RS485SensorEntityDescription
 
     def __init__(
         self,
         hass: HomeAssistant,
-        config: dict[str, Any],
+        coordinator: RS485SensorCoordinator,
+        *,
+        slave: int,
+        entry_id: str,
         description: RS485SensorEntityDescription,
     ) -> None:
         """Initialize the RS485Sensor."""
+        super().__init__(coordinator)
+        self._entry_id: str = entry_id
         self.hass = hass
         self.entity_description = description
-        self._state = None
-        self._slave: int = config.get(CONF_SLAVE, 0)
-        self._entry_id: str = config.get("entry_id", "")
+        self._slave: int = slave
         self._unique_id: str = (
             f"{self._entry_id}_{self.entity_description.key}_{self._slave}"
         )
-        self.coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=self.entity_description.name,
-            update_method=self.async_update,
-            update_interval=timedelta(seconds=5),
-        )
-
-    @property
-    def unique_id(self) -> str:
-        """返回實體的唯一 ID."""
-        return self._unique_id
-
-    @property
-    def name(self) -> str:
-        """返回實體的名稱."""
-        return self.entity_description.name
-
-    @property
-    def device_class(self):
-        """Return the class of this device, from component DEVICE_CLASSES."""
-        return self.entity_description.device_class
-
-    @property
-    def native_unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return self.entity_description.native_unit_of_measurement
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        device = self.hass.data[DOMAIN][self._entry_id]["device"]
-        return {
-            "identifiers": device.identifiers,
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.model,
-            "connections": device.connections,
-        }
+        self._attr_unique_id = self._unique_id
+        self._attr_name = description.name
+        self._attr_device_class = description.device_class
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
+        self._attr_native_value = coordinator.get_register(description.address)
+        self._entry_data: dict[str, Any] = self.hass.data[DOMAIN][self._entry_id]
+        self._attr_device_info: DeviceInfo = self._entry_data["device_info"]
+
+    async def async_added_to_hass(self) -> None:
+        """當實體添加到 Home Assistant 時，啟動協調器."""
+        await super().async_added_to_hass()
+        await self.coordinator.async_start()
 
-    @property
-    def native_value(self) -> StateType:
-        """更新實體的狀態."""
-        return self._state
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """協調器取得新數據時更新實體的數值."""
+        self._attr_native_value = self.coordinator.get_register(
+            self.entity_description.address
+        )
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> dict[str, Any]:
         """返回传感器的当前状态，映射为具体描述."""
         if self.entity_description.key == "human_radar":
-            return {0: "無人", 1: "靜止", 2: "活動"}.get(self._state, "未知")
+            return HUMAN_RADAR_STATE.get(self.native_value, "未知")
 
-        return self._state
+        return self.native_value
 
     @property
     def device_state_attributes(self) -> dict[str, Any]:
         """返回設備的其他狀態屬性."""
         if self.entity_description.key == "human_radar":
-            return {
-                "description": {0: "無人", 1: "靜止", 2: "活動"}.get(
-                    self._state, "未知"
-                )
-            }
+            return {"description": HUMAN_RADAR_STATE.get(self.native_value, "未知")}
         return {}
-
-    async def async_added_to_hass(self):
-        """當實體添加到 Home Assistant 時，設置狀態更新的計劃."""
-        await super().async_added_to_hass()
-        await self.coordinator.async_refresh()
-
-    async def async_will_remove_from_hass(self):
-        """當實體從 Home Assistant 中移除時，取消計劃."""
-
-    async def async_update(self):
-        """更新狀態."""
-        if self.hass.data[DOMAIN][self._entry_id][CONF_STATE] is not None:
-            self._state = self.hass.data[DOMAIN][self._entry_id][CONF_STATE][
-                self.entity_description.address - 11
-            ]
-            self.schedule_update_ha_state()
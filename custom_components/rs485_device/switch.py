@@ -2,7 +2,6 @@
 import asyncio
 from datetime import timedelta
 import logging
-import math
 from typing import Any, Final
 
 from homeassistant.components.switch import SwitchEntity
@@ -20,7 +19,6 @@ _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=5)
 
 DEFAULT_STATE: Final = 256
-PLACEHOLDER: Final = "00000000"
 REGISTER_ADDRESS: Final = 0x1008
 
 
@@ -30,16 +28,22 @@ async def async_setup_entry(
     """通過配置條目設置開關實體."""
 
     # 從 entry.data 中獲取配置數據
-    config = {
-        **entry.data,
-        "entry_id": entry.entry_id,
-    }
-
-    switch_count = entry.data.get(CONF_COUNT, 1)
-    switches = []
-    for i in range(switch_count):
-        switches.append(RS485Switch(hass, config, i + 1))
-    async_add_entities(switches, True)
+    slave: int = entry.data.get(CONF_SLAVE, 0)
+    has_relay: bool = entry.data.get(HAS_RELAY, True)
+    switch_count: int = entry.data.get(CONF_COUNT, 1)
+    async_add_entities(
+        [
+            RS485Switch(
+                hass,
+                slave=slave,
+                entry_id=entry.entry_id,
+                switch_index=i + 1,
+                has_relay=has_relay,
+            )
+            for i in range(switch_count)
+        ],
+        True,
+    )
 
 
 class RS485Switch(SwitchEntity):
@@ -49,126 +53,82 @@ class RS485Switch(SwitchEntity):
     _attr_should_poll = False
 
     def __init__(
-        self, hass: HomeAssistant, config: dict[str, Any], switch_index: int
+        self,
+        hass: HomeAssistant,
+        *,
+        slave: int,
+        entry_id: str,
+        switch_index: int,
+        has_relay: bool = True,
     ) -> None:
         """初始化開關."""
         self.hass = hass
         self._is_on: bool = False
-        self._slave: int = config.get(CONF_SLAVE, 0)
+        self._slave: int = slave
         self._state: int = DEFAULT_STATE
-        self._has_relay: bool = config.get(HAS_RELAY, True)
-        self._entry_id: str = config.get("entry_id", "")
+        self._has_relay: bool = has_relay
+        self._entry_id: str = entry_id
         self._index: int = switch_index
-        self._name: str = f"Button_{self._index}"
-        self._identify = int(str(self._slave) + str(self._index))
+        self._attr_name = f"Button_{self._index}"
+        # identify 只佔 MBAP 交易 ID 的一個 byte，取低位元組避免 slave 較大時超出範圍
+        self._identify = int(str(self._slave) + str(self._index)) & 0xFF
         self._unique_id: str = f"{self._entry_id}_{self._index}"
-        self._publisher: RS485TcpPublisher = self.hass.data[DOMAIN][
-            "rs485_tcp_publisher"
-        ]
-        self._identify_set: set[int] = self.hass.data[DOMAIN]["identify"]
-        self._slaves_set: set[int] = self.hass.data[DOMAIN]["slaves"]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        device = self.hass.data[DOMAIN][self._entry_id]["device"]
-        return {
-            "identifiers": device.identifiers,
-            "name": device.name,
-            "manufacturer": device.manufacturer,
-            "model": device.model,
-            "connections": device.connections,
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """返回實體的唯一 ID."""
-        return self._unique_id
-
-    @property
-    def name(self) -> str:
-        """返回實體的名稱."""
-        return self._name
+        self._attr_unique_id = self._unique_id
+        self._entry_data: dict[str, Any] = self.hass.data[DOMAIN][self._entry_id]
+        self._publisher: RS485TcpPublisher = self._entry_data["rs485_tcp_publisher"]
+        # 讀取開關狀態的訊息，在實體的生命週期內不會改變
+        self._read_frame: bytes = self._publisher.construct_modbus_message(
+            self._slave, 3, REGISTER_ADDRESS, length=1, identify=self._identify
+        )
+        self._attr_device_info: DeviceInfo = self._entry_data["device_info"]
 
     @property
     def is_on(self) -> bool:
         """如果開關打開，返回 True."""
         return self._is_on
 
-    def _binary_list_to_int(self, binary_list: list[int]) -> int:
-        """將二進制列表轉換為整數."""
-        high_byte = binary_list[0]
-        low_byte = binary_list[1]
-        result = (high_byte << 8) + (low_byte & 0xFF)
-        return result
-
-    async def _watchdogs(self):
-        """監控 Publisher 是否運行."""
-        read_message = self._publisher.construct_modbus_message(
-            self._slave, 3, REGISTER_ADDRESS, length=1, identify=self._identify
-        )
-        watchdog_task: asyncio.Task = self.hass.data[DOMAIN][self._entry_id][
-            "watchdog_task"
-        ]
-        try:
-            while True:
-                _LOGGER.warning(
-                    "❓ Publisher is running?: %s ❓", self._publisher.is_running
-                )
-                if self._publisher.is_running:
-                    await asyncio.sleep(0.1 + self._slave / 10)
-                    await asyncio.wait_for(
-                        self._publisher.send_message(read_message),
-                        timeout=2 * self._slave,
-                    )
-                    watchdog_task.cancel()
-                await asyncio.sleep(3)
-        except asyncio.CancelledError:
-            _LOGGER.info("Watchdog task was cancelled")
-            return
-
     async def _handle_switch(self, is_on: bool) -> None:
         """處理開關的切換."""
-        self.hass.data[DOMAIN][self._entry_id][CONF_SWITCHES] = self._index
-        read_message = self._publisher.construct_modbus_message(
-            self._slave, 3, REGISTER_ADDRESS, length=1, identify=self._identify
-        )
-        await self._publisher.send_message(read_message)
-        await asyncio.sleep(0.1)
-        state = self.hass.data[DOMAIN][self._entry_id][CONF_STATE]
-        value = state ^ self._index
+        self._entry_data[CONF_SWITCHES] = self._index
+        # 狀態會由 _subscribe_callback 持續更新，只有還沒有狀態時才先讀取
+        state = self._entry_data[CONF_STATE]
+        if state is None:
+            await self._publisher.send_message(self._read_frame)
+            await self._publisher.flush()
+            await asyncio.sleep(0.1)
+            state = self._entry_data[CONF_STATE]
+            if state is None:
+                _LOGGER.error("⛔️ 無法取得 slave %s 的開關狀態 ⛔️", self._slave)
+                return
+
+        value = state ^ (1 << (self._index - 1))
         write_message = self._publisher.construct_modbus_message(
             self._slave, 6, REGISTER_ADDRESS, value=value, identify=self._identify
         )
         await self._publisher.send_message(write_message)
-        self.hass.data[DOMAIN][self._entry_id][CONF_STATE] = value
+        await self._publisher.flush()
+        self._entry_data[CONF_STATE] = value
         self._is_on = is_on
         self.async_write_ha_state()
 
-    async def _subscribe_callback(self, sub_id: str, data: tuple[int]) -> None:
+    async def _subscribe_callback(self, sub_id: str, data: bytes) -> None:
         """訂閱回調."""
 
         if len(data) < 8:
             return
-        identify: set[int] = self._identify_set - {self._identify}
-        slaves: set[int] = self._slaves_set - {self._slave}
-        if data[1] in identify and data[6] in slaves:
-            return
 
-        _length, slave, function_code, *_last = data[5:]
+        # Modbus TCP 的欄位位置固定：data[5] 長度、data[6] slave、data[7] 功能碼，
+        # 狀態值為最後兩個 byte
+        length, slave, function_code = data[5], data[6], data[7]
 
         # [0,0,0,0,0,6,3,3,0,2,13,1]
         # 弱電版本的開關不管是按下實體按鈕，或是讀取狀態，都會回傳 6 bytes
         # 而有繼電器版本的開關，當按下實體按鈕時，會回傳 6 bytes，讀取狀態時，會回傳 5 bytes
         # 所以透過第十一位的值來判斷行為是否為手動觸發或是讀取狀態
-        # 當第十一位的值等於 256 時，表示是讀取狀態，所以將 last 的第一位去掉，並改變 length
+        # 當第十一位的值等於 1 (即狀態值為 256) 時，表示是讀取狀態，所以將 length 減一
         # 讓接下來的判斷依照有繼電器版本的開關來處理
-        if self._has_relay is False and (_last[-2:][0] << 8) == 256:
-            last = _last[1:]
-            length = _length - 1
-        else:
-            last = _last
-            length = _length
+        if self._has_relay is False and data[-2] == 1:
+            length -= 1
 
         # 如果是手動觸發，則紀錄按下的是哪個按鈕
         # 弱電版本的開關，按下按鈕時會回傳兩筆資料
@@ -176,56 +136,41 @@ class RS485Switch(SwitchEntity):
         # 第二筆是按鈕的狀態 [0,0,0,0,0,6,3,3,0,2,1,0]
         # 因為第二筆的資料判斷到最後一位是 0，則直接跳出
         if length == 6 and function_code == 3:
-            ls = last[-1:][0]
+            ls = data[-1]
             if ls == 0:
                 return
-            m = math.log(ls, 2)
-            self.hass.data[DOMAIN][self._entry_id][CONF_SWITCHES] = int(m) + 1
+            self._entry_data[CONF_SWITCHES] = ls.bit_length()
 
         # 紀錄按下的是哪個按鈕
-        switch_index = self.hass.data[DOMAIN][self._entry_id][CONF_SWITCHES]
+        switch_index = self._entry_data[CONF_SWITCHES]
 
         if slave == self._slave:
             if switch_index == self._index:
-                _LOGGER.info(
-                    "🚧 Subscribe callback DATA:%s / SLAVE: %s / INDEX: %s / index: %s / LAST: %s 🚧 ",
-                    self._slave,
-                    data,
-                    switch_index,
-                    self._index,
-                    last,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "🚧 Subscribe callback SLAVE: %s / DATA: %s / INDEX: %s 🚧",
+                        self._slave,
+                        data.hex(" "),
+                        self._index,
+                    )
 
                 if function_code == 3:
                     # step_3-5
                     # 如果是讀取寄存器而且是讀取狀態，則將狀態更新到 DOMAIN 裡提供給其他開關使用
                     if length == 5:
-                        self.hass.data[DOMAIN][self._entry_id][
-                            CONF_STATE
-                        ] = self._binary_list_to_int(last[-2:])
+                        self._entry_data[CONF_STATE] = (data[-2] << 8) | data[-1]
 
                     # step_3-6
                     # 如果是按下實體按鈕，則讀取狀態，會進入到 step_3-5
                     elif length == 6:
-                        read_message = self._publisher.construct_modbus_message(
-                            self._slave,
-                            3,
-                            REGISTER_ADDRESS,
-                            length=1,
-                            identify=self._identify,
-                        )
-                        await self._publisher.send_message(read_message)
+                        await self._publisher.send_message(self._read_frame)
                 # 如果是寫入寄存器，則將更新後的狀態更新到 DOMAIN 裡提供給其他開關使用
                 elif function_code == 6:
-                    self.hass.data[DOMAIN][self._entry_id][
-                        CONF_STATE
-                    ] = self._binary_list_to_int(last[-2:])
+                    self._entry_data[CONF_STATE] = (data[-2] << 8) | data[-1]
 
             # 這裡是為了讓其他不是在 HA 裡的操作也能更新狀態
             elif (function_code == 3 and length == 5) or function_code == 6:
-                self.hass.data[DOMAIN][self._entry_id][
-                    CONF_STATE
-                ] = self._binary_list_to_int(last[-2:])
+                self._entry_data[CONF_STATE] = (data[-2] << 8) | data[-1]
         else:
             return
 
@@ -236,14 +181,13 @@ class RS485Switch(SwitchEntity):
         # 當實體添加到 Home Assistant 時，起始連接 rs-485 伺服器
         await self._publisher.start()
         # 訂閱數據
-        await self._publisher.subscribe(self._subscribe_callback, self._unique_id)
-        # 設置 watchdog 任務
-        if self.hass.data[DOMAIN][self._entry_id]["watchdog_task"] is None:
-            self.hass.data[DOMAIN][self._entry_id][
-                "watchdog_task"
-            ] = asyncio.create_task(self._watchdogs())
-        self._identify_set.add(self._identify)
-        self._slaves_set.add(self._slave)
+        await self._publisher.subscribe(
+            self._subscribe_callback, self._unique_id, slave=self._slave
+        )
+        # 連線後由 watchdog 讀取開關的初始狀態，同一個 slave 的請求會合併成一次讀取
+        self._entry_data["watchdog_queue"].put_nowait(
+            (self._slave, REGISTER_ADDRESS, self._identify)
+        )
         # 設置狀態更新的計劃
         _LOGGER.info("🚧 Added to hass 🚧 %s", self._index)
 
@@ -261,10 +205,10 @@ class RS485Switch(SwitchEntity):
 
     async def async_update(self):
         """更新開關的狀態."""
-        state = self.hass.data[DOMAIN][self._entry_id][CONF_STATE]
-        switch_index = self.hass.data[DOMAIN][self._entry_id][CONF_SWITCHES]
+        state = self._entry_data[CONF_STATE]
+        switch_index = self._entry_data[CONF_SWITCHES]
         if switch_index == self._index:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "🚧 ------- SLAVE: %s / STATE:%s / index: %s ------- 🚧",
                 self._slave,
                 state,
@@ -272,9 +216,8 @@ class RS485Switch(SwitchEntity):
             )
 
         if state is not None:
-            state_str = bin(state % DEFAULT_STATE)[2:]
-            binary_string = PLACEHOLDER[: len(PLACEHOLDER) - len(state_str)] + state_str
-            self._is_on = binary_string[::-1][self._index - 1] == "1"
+            # 每個按鈕對應狀態的一個位元，第 n 個按鈕為第 n-1 位
+            self._is_on = bool((state >> (self._index - 1)) & 1)
             self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs):